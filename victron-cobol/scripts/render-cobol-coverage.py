@@ -4,18 +4,42 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import html
 import json
+import mmap
+import os
 import pathlib
 import re
-from typing import Dict, List, Optional
-
-LINE_COMMENT_RE = re.compile(r"/\* Line:\s*(\d+)\s*:.*:\s*(.+?)\s*\*/")
-BRANCH_TAKEN_RE = re.compile(r"branch\s+(\d+)\s+taken\s+(\d+)%")
-BRANCH_NEVER_RE = re.compile(r"branch\s+(\d+)\s+never executed")
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One pass over the whole gcov buffer: every alternative is anchored at a line
+# start, so each line yields at most one match and non-matching lines are
+# skipped inside the regex engine. Non-executable "-:" count lines, the bulk
+# of a gcov file, deliberately match nothing so they never reach Python.
+GCOV_RECORD_RE = re.compile(
+    rb"^(?:"
+    rb"(?P<comment>.*?/\* Line:[ \t]*(?P<line>\d+)[ \t]*:.*:[ \t]*(?P<source>.+?)[ \t]*\*/)"
+    rb"|[ \t]*(?P<branch>branch[ \t]+(?P<branch_id>\d+)[ \t]+"
+    rb"(?:taken[ \t]+(?P<pct>\d+)%|never executed)[^\n]*?)[ \t\r]*$"
+    rb"|[ \t]*(?P<count>#####|=====|\d+)[ \t]*:[ \t]*\d+[ \t]*:"
+    rb")",
+    re.MULTILINE,
+)
 
 CoverageMap = Dict[int, Dict[str, object]]
 
+# Shared, read-only stand-in for source lines that gcov reported nothing for.
+_DEFAULT_ENTRY: Mapping[str, object] = MappingProxyType(
+    {"hits": None, "executable": False, "branches": MappingProxyType({})}
+)
+
 
 def parse_gcov(gcov_path: pathlib.Path, source_basename: str) -> CoverageMap:
     results: CoverageMap = {}
@@ -42,22 +66,31 @@ def parse_gcov(gcov_path: pathlib.Path, source_basename: str) -> CoverageMap:
             existing = entry.setdefault("branches", {}).get(branch_id)
             if existing is None or info["pct"] > existing["pct"]:
                 entry["branches"][branch_id] = info
+        # gcov numbers branches 0..n-1 per C line, so ids are always inserted in
+        # ascending order and the renderers can iterate without sorting.
+        if __debug__ and branches:
+            ids = list(entry["branches"])
+            assert all(a < b for a, b in zip(ids, ids[1:])), f"branch ids out of order: {ids}"
         current_line = None
         counts = []
         branches = {}
 
-    with gcov_path.open("r", encoding="utf-8") as handle:
-        for raw_line in handle:
-            raw_line = raw_line.rstrip("\n")
+    if gcov_path.stat().st_size == 0:
+        return results
+
+    source_name = os.fsencode(source_basename)
+    with gcov_path.open("rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buffer:
+        for match in GCOV_RECORD_RE.finditer(buffer):
+            kind = match.lastgroup
 
-            match = LINE_COMMENT_RE.search(raw_line)
-            if match:
+            if kind == "comment":
                 flush()
-                source_name = pathlib.Path(match.group(2)).name
-                if source_name != source_basename:
+                if os.path.basename(match["source"]) != source_name:
                     current_line = None
                     continue
-                current_line = int(match.group(1))
+                current_line = int(match["line"])
                 counts = []
                 branches = {}
                 continue
@@ -65,66 +98,39 @@ def parse_gcov(gcov_path: pathlib.Path, source_basename: str) -> CoverageMap:
             if current_line is None:
                 continue
 
-            stripped = raw_line.strip()
-            if not stripped:
-                continue
-
-            branch_taken = BRANCH_TAKEN_RE.search(stripped)
-            if branch_taken:
-                branch_id = int(branch_taken.group(1))
-                pct = int(branch_taken.group(2))
-                branches[branch_id] = {"pct": pct, "detail": stripped}
-                continue
-
-            branch_never = BRANCH_NEVER_RE.search(stripped)
-            if branch_never:
-                branch_id = int(branch_never.group(1))
-                branches[branch_id] = {"pct": 0, "detail": stripped}
-                continue
-
-            if stripped.startswith("call") or stripped.startswith("function"):
+            if kind == "branch":
+                branch_id = int(match["branch_id"])
+                pct = match["pct"]
+                branches[branch_id] = {
+                    "pct": int(pct) if pct is not None else 0,
+                    "detail": match["branch"].decode("utf-8"),
+                }
                 continue
 
-            parts = raw_line.split(":", 2)
-            if len(parts) < 3:
-                continue
-
-            count_field = parts[0].strip()
-            line_field = parts[1].strip()
-            if not line_field.isdigit() or not count_field:
-                continue
-
-            if count_field in {"-"}:
-                continue
-            if count_field in {"#####", "====="}:
+            count_field = match["count"]
+            if count_field in (b"#####", b"====="):
                 counts.append(0)
                 continue
-            try:
-                counts.append(int(count_field))
-            except ValueError:
-                continue
+            counts.append(int(count_field))
 
     flush()
     return results
 
 
 def compute_summary(coverage: CoverageMap) -> Dict[str, Dict[str, int]]:
-    line_totals = {"total": 0, "covered": 0}
-    branch_totals = {"total": 0, "covered": 0}
-
-    for entry in coverage.values():
-        if not entry.get("executable"):
-            continue
-        line_totals["total"] += 1
-        hits = entry.get("hits")
-        if isinstance(hits, int) and hits > 0:
-            line_totals["covered"] += 1
-        for info in entry.get("branches", {}).values():
-            branch_totals["total"] += 1
-            if info.get("pct", 0) > 0:
-                branch_totals["covered"] += 1
-
-    return {"lines": line_totals, "branches": branch_totals}
+    executable = [entry for entry in coverage.values() if entry.get("executable")]
+    line_covered = sum(
+        1 for entry in executable if isinstance(entry.get("hits"), int) and entry["hits"] > 0
+    )
+    branch_infos = [
+        info for entry in executable for info in entry.get("branches", {}).values()
+    ]
+    branch_covered = sum(1 for info in branch_infos if info.get("pct", 0) > 0)
+
+    return {
+        "lines": {"total": len(executable), "covered": line_covered},
+        "branches": {"total": len(branch_infos), "covered": branch_covered},
+    }
 
 
 def percent(covered: int, total: int) -> str:
@@ -133,9 +139,41 @@ def percent(covered: int, total: int) -> str:
     return f"{(covered / total) * 100:.1f}%"
 
 
+def _line_payload(idx: int, text: str, entry: Mapping[str, object]) -> Dict[str, object]:
+    executable = bool(entry.get("executable"))
+    hits = entry.get("hits")
+    branches = entry.get("branches")
+    branch_items = (
+        [
+            {"id": branch_id, "pct": info.get("pct", 0), "detail": info.get("detail", "")}
+            for branch_id, info in branches.items()
+        ]
+        if branches
+        else []
+    )
+    if not executable:
+        status = "noncode"
+    elif isinstance(hits, int) and hits > 0:
+        if branch_items and any(item["pct"] == 0 for item in branch_items):
+            status = "partial"
+        else:
+            status = "covered"
+    else:
+        status = "missed"
+    return {
+        "line": idx,
+        "hits": hits,
+        "executable": executable,
+        "status": status,
+        "branches": branch_items,
+        "source": text,
+    }
+
+
 def build_json_payload(coverage: CoverageMap, cobol_lines: List[str]) -> Dict[str, object]:
     summary = compute_summary(coverage)
-    payload: Dict[str, object] = {
+    cov_get = coverage.get
+    return {
         "summary": {
             "lines": {
                 "covered": summary["lines"]["covered"],
@@ -148,44 +186,30 @@ def build_json_payload(coverage: CoverageMap, cobol_lines: List[str]) -> Dict[st
                 "percent": percent(summary["branches"]["covered"], summary["branches"]["total"]),
             },
         },
-        "lines": [],
+        "lines": [
+            _line_payload(idx, text, cov_get(idx, _DEFAULT_ENTRY))
+            for idx, text in enumerate(cobol_lines, start=1)
+        ],
     }
 
-    for idx, text in enumerate(cobol_lines, start=1):
-        entry = coverage.get(idx, {"hits": None, "executable": False, "branches": {}})
-        executable = bool(entry.get("executable"))
-        hits = entry.get("hits")
-        branches = entry.get("branches", {})
-        branch_items = []
-        for branch_id in sorted(branches):
-            info = branches[branch_id]
-            branch_items.append({
-                "id": branch_id,
-                "pct": info.get("pct", 0),
-                "detail": info.get("detail", ""),
-            })
-        if not executable:
-            status = "noncode"
-        elif isinstance(hits, int) and hits > 0:
-            if branch_items and any(item["pct"] == 0 for item in branch_items):
-                status = "partial"
-            else:
-                status = "covered"
-        else:
-            status = "missed"
-        payload["lines"].append({
-            "line": idx,
-            "hits": hits,
-            "executable": executable,
-            "status": status,
-            "branches": branch_items,
-            "source": text,
-        })
-    return payload
+
+def dump_json(payload: Dict[str, object], pretty: bool = False) -> bytes:
+    """Serialize the payload, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(payload, indent=2).encode("utf-8")
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
 
 
+@functools.lru_cache(maxsize=4096)
 def highlight_cobol(line: str) -> str:
-    """Apply COBOL syntax highlighting with HTML spans."""
+    """Apply COBOL syntax highlighting with HTML spans.
+
+    Cached per line text: COBOL sources repeat many lines verbatim (blank
+    lines, ``END-IF.``, ``EXIT.``), and escaping plus the keyword passes are
+    pure functions of the text.
+    """
     # Escape HTML first
     result = html.escape(line)
     
@@ -241,61 +265,8 @@ def highlight_cobol(line: str) -> str:
     return result
 
 
-def render_html(coverage: CoverageMap, cobol_lines: List[str], title: str) -> str:
-    summary = compute_summary(coverage)
-    line_totals = summary["lines"]
-    branch_totals = summary["branches"]
-    line_percent = percent(line_totals["covered"], line_totals["total"])
-    branch_percent = percent(branch_totals["covered"], branch_totals["total"])
-
-    rows: List[str] = []
-    for idx, text in enumerate(cobol_lines, start=1):
-        entry = coverage.get(idx, {"hits": None, "executable": False, "branches": {}})
-        executable = bool(entry.get("executable"))
-        hits = entry.get("hits")
-        branches = entry.get("branches", {})
-        branch_total = len(branches)
-        branch_covered = sum(1 for info in branches.values() if info.get("pct", 0) > 0)
-
-        if not executable:
-            css_class = "nonexec"
-            hits_display = "-"
-        elif isinstance(hits, int) and hits > 0:
-            css_class = "partial" if branch_total and branch_covered < branch_total else "covered"
-            hits_display = str(hits)
-        else:
-            css_class = "missed"
-            hits_display = "0"
-
-        if branch_total:
-            branch_info = f"{branch_covered}/{branch_total}"
-            branch_tooltip = " | ".join(
-                info.get("detail", "") for _, info in sorted(branches.items())
-            )
-            branch_tooltip = html.escape(branch_tooltip)
-            branch_cell = (
-                f'<td class="branch-cell" title="{branch_tooltip}">{branch_info}</td>'
-            )
-        else:
-            branch_cell = '<td class="branch-cell">-</td>'
-
-        # Apply COBOL syntax highlighting to the code
-        highlighted_code = highlight_cobol(text)
-
-        rows.append(
-            "<tr class=\"{cls}\"><td class=\"line-no\">{line}</td>"
-            "<td class=\"hit-count\">{hits}</td>{branch}<td class=\"code\">{code}</td></tr>".format(
-                cls=css_class,
-                line=idx,
-                hits=hits_display,
-                branch=branch_cell,
-                code=highlighted_code,
-            )
-        )
-
-    rows_html = "\n    ".join(rows)
-
-    style = """
+# Static parts of the HTML report; only the title, summary and rows vary per call
+_STYLE = """
 /* IBM 3270 Mainframe Terminal - Authentic */
 @font-face {
     font-family: '3270';
@@ -420,32 +391,25 @@ th {
 .legend .nonexec { background: #000000; border-left: 3px solid #333333; }
     """
 
-    return f"""
+_HEAD_OPEN = """
 <!DOCTYPE html>
 <html>
 <head>
 <meta charset=\"UTF-8\">
-<title>{html.escape(title)}</title>
-<style>{style}</style>
+<title>"""
+_HEAD_STYLE = f"""</title>
+<style>{_STYLE}</style>
 </head>
 <body>
-<h1>{html.escape(title)}</h1>
-<div class=\"summary\">
-  <div class=\"summary-card\">
-    <h2>Line Coverage</h2>
-    <p>{line_percent} ({line_totals['covered']} / {line_totals['total']})</p>
-  </div>
-  <div class=\"summary-card\">
-    <h2>Branch Coverage</h2>
-    <p>{branch_percent} ({branch_totals['covered']} / {branch_totals['total']})</p>
-  </div>
-</div>
+<h1>"""
+_TABLE_OPEN = """
 <table>
   <thead>
     <tr><th class=\"line-no\">Line</th><th class=\"hit-count\">Hits</th><th class=\"branch-cell\">Branches</th><th>Code</th></tr>
   </thead>
   <tbody>
-    {rows_html}
+    """
+_FOOT = """
   </tbody>
 </table>
 <div class=\"legend\">
@@ -459,6 +423,84 @@ th {
 """
 
 
+def render_html_stream(
+    coverage: CoverageMap, cobol_lines: List[str], title: str
+) -> Iterator[str]:
+    """Yield the HTML report in chunks so it can be written without joining."""
+    summary = compute_summary(coverage)
+    line_totals = summary["lines"]
+    branch_totals = summary["branches"]
+    line_percent = percent(line_totals["covered"], line_totals["total"])
+    branch_percent = percent(branch_totals["covered"], branch_totals["total"])
+
+    escaped_title = html.escape(title)
+    yield _HEAD_OPEN
+    yield escaped_title
+    yield _HEAD_STYLE
+    yield escaped_title
+    yield f"""</h1>
+<div class=\"summary\">
+  <div class=\"summary-card\">
+    <h2>Line Coverage</h2>
+    <p>{line_percent} ({line_totals['covered']} / {line_totals['total']})</p>
+  </div>
+  <div class=\"summary-card\">
+    <h2>Branch Coverage</h2>
+    <p>{branch_percent} ({branch_totals['covered']} / {branch_totals['total']})</p>
+  </div>
+</div>"""
+    yield _TABLE_OPEN
+
+    escape = html.escape
+    cov_get = coverage.get
+    separator = ""
+    for idx, text in enumerate(cobol_lines, start=1):
+        entry = cov_get(idx, _DEFAULT_ENTRY)
+        executable = bool(entry.get("executable"))
+        hits = entry.get("hits")
+        branches = entry.get("branches", {})
+        branch_total = len(branches)
+        branch_covered = sum(1 for info in branches.values() if info.get("pct", 0) > 0)
+
+        if not executable:
+            css_class = "nonexec"
+            hits_display = "-"
+        elif isinstance(hits, int) and hits > 0:
+            css_class = "partial" if branch_total and branch_covered < branch_total else "covered"
+            hits_display = str(hits)
+        else:
+            css_class = "missed"
+            hits_display = "0"
+
+        if branch_total:
+            branch_info = f"{branch_covered}/{branch_total}"
+            branch_tooltip = " | ".join(
+                info.get("detail", "") for info in branches.values()
+            )
+            branch_tooltip = escape(branch_tooltip)
+            branch_cell = (
+                f'<td class="branch-cell" title="{branch_tooltip}">{branch_info}</td>'
+            )
+        else:
+            branch_cell = '<td class="branch-cell">-</td>'
+
+        # Apply COBOL syntax highlighting to the code
+        highlighted_code = highlight_cobol(text)
+
+        yield (
+            f'{separator}<tr class="{css_class}"><td class="line-no">{idx}</td>'
+            f'<td class="hit-count">{hits_display}</td>{branch_cell}'
+            f'<td class="code">{highlighted_code}</td></tr>'
+        )
+        separator = "\n    "
+
+    yield _FOOT
+
+
+def render_html(coverage: CoverageMap, cobol_lines: List[str], title: str) -> str:
+    return "".join(render_html_stream(coverage, cobol_lines, title))
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Render COBOL coverage HTML from gcov output")
     parser.add_argument("--gcov", required=True, type=pathlib.Path, help="Path to SOLARCOST.c.gcov")
@@ -466,19 +508,20 @@ def main() -> None:
     parser.add_argument("--output", required=True, type=pathlib.Path, help="Output HTML report path")
     parser.add_argument("--json", type=pathlib.Path, help="Optional JSON output path")
     parser.add_argument("--title", default="COBOL Coverage", help="Report title")
+    parser.add_argument("--pretty", action="store_true", help="Indent the JSON output")
     args = parser.parse_args()
 
     coverage = parse_gcov(args.gcov, args.source.name)
     cobol_lines = args.source.read_text(encoding="utf-8").splitlines()
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    html_report = render_html(coverage, cobol_lines, args.title)
-    args.output.write_text(html_report, encoding="utf-8")
+    with args.output.open("w", encoding="utf-8") as handle:
+        handle.writelines(render_html_stream(coverage, cobol_lines, args.title))
 
     if args.json:
         args.json.parent.mkdir(parents=True, exist_ok=True)
         payload = build_json_payload(coverage, cobol_lines)
-        args.json.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        args.json.write_bytes(dump_json(payload, pretty=args.pretty))
 
     summary = compute_summary(coverage)
     line_totals = summary["lines"]
@@ -1,4 +1,10 @@
-"""Cost analysis module for solar energy savings calculations."""
+"""Cost analysis module for solar energy savings calculations.
+
+Only the Yield(Wh) and Consumption(Wh) columns are read, so callers holding a CSV path can
+pass a lazy scan and let Polars skip every other column while parsing::
+
+    report = generate_cost_report(pl.scan_csv("SolarHistory.csv"))
+"""
 
 from dataclasses import dataclass
 from pathlib import Path
@@ -7,7 +13,7 @@ import polars as pl
 from loguru import logger
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CostReport:
     """Solar energy cost analysis report."""
 
@@ -24,11 +30,12 @@ class CostReport:
     projected_annual_savings_usd: float
 
 
-def generate_cost_report(df: pl.DataFrame, rate_per_kwh: float = 0.14) -> CostReport:
+def generate_cost_report(df: pl.DataFrame | pl.LazyFrame, rate_per_kwh: float = 0.14) -> CostReport:
     """Generate financial analysis of solar energy savings.
 
     Args:
-        df: Polars DataFrame with solar data (must include Yield(Wh) and Consumption(Wh))
+        df: Polars DataFrame or LazyFrame with solar data (must include Yield(Wh) and
+            Consumption(Wh)); a LazyFrame is only collected for the two columns needed
         rate_per_kwh: Electricity rate in USD per kilowatt-hour (default: $0.14/kWh)
 
     Returns:
@@ -37,16 +44,26 @@ def generate_cost_report(df: pl.DataFrame, rate_per_kwh: float = 0.14) -> CostRe
     Raises:
         ValueError: If required columns are missing
     """
+    lf = df.lazy()
     required_cols = ["Yield(Wh)", "Consumption(Wh)"]
-    if not all(col in df.columns for col in required_cols):
+    if not all(col in lf.collect_schema().names() for col in required_cols):
         msg = f"DataFrame must contain {required_cols}"
         raise ValueError(msg)
 
     logger.info(f"Generating cost report with rate ${rate_per_kwh:.3f}/kWh")
 
+    # Sum both columns and count rows in a single pass
+    total_solar_wh, total_consumption_wh, days = (
+        lf.select(
+            pl.col("Yield(Wh)").sum(),
+            pl.col("Consumption(Wh)").sum(),
+            pl.len(),
+        )
+        .collect()
+        .row(0)
+    )
+
     # Convert Wh to kWh
-    total_solar_wh = df["Yield(Wh)"].sum()
-    total_consumption_wh = df["Consumption(Wh)"].sum()
     total_solar_kwh = total_solar_wh / 1000
     total_consumption_kwh = total_consumption_wh / 1000
 
@@ -61,7 +78,6 @@ def generate_cost_report(df: pl.DataFrame, rate_per_kwh: float = 0.14) -> CostRe
     )
 
     # Daily averages
-    days = df.height
     avg_daily_solar_kwh = total_solar_kwh / days if days > 0 else 0
     avg_daily_consumption_kwh = total_consumption_kwh / days if days > 0 else 0
 
@@ -148,11 +164,13 @@ solar array to maximize ROI and reduce grid dependence.
 """
 
 
-def save_cost_report(df: pl.DataFrame, output_path: Path | str, rate_per_kwh: float = 0.14) -> None:
+def save_cost_report(
+    df: pl.DataFrame | pl.LazyFrame, output_path: Path | str, rate_per_kwh: float = 0.14
+) -> None:
     """Generate and save cost report to file.
 
     Args:
-        df: Polars DataFrame with solar data
+        df: Polars DataFrame or LazyFrame with solar data
         output_path: Path to save the text report
         rate_per_kwh: Electricity rate in USD per kilowatt-hour (default: $0.14/kWh)
     """
@@ -6,7 +6,7 @@ import polars as pl
 from loguru import logger
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of a data quality validation check."""
 
@@ -16,7 +16,7 @@ class ValidationResult:
     rows_affected: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataQualityReport:
     """Comprehensive data quality report."""
 
@@ -65,8 +65,23 @@ def validate_solar_data(df: pl.DataFrame) -> DataQualityReport:
         )
     )
 
+    # Gather the row-level statistics for checks 2-5 in a single pass
+    has_date = "Date" in df.columns
+    has_battery = "Min. battery voltage(V)" in df.columns
+    stat_exprs = [
+        pl.col("Yield(Wh)").null_count().alias("yield_nulls"),
+        (pl.col("Yield(Wh)") < 0).sum().alias("yield_negative"),
+    ]
+    if has_date:
+        stat_exprs.append(pl.col("Date").null_count().alias("date_nulls"))
+    if has_battery:
+        stat_exprs.append(
+            pl.col("Min. battery voltage(V)").is_between(10, 16).not_().sum().alias("battery_oor")
+        )
+    stats = df.lazy().select(stat_exprs).collect().row(0, named=True)
+
     # Check 2: No null values in Yield column
-    null_count = df["Yield(Wh)"].null_count()
+    null_count = stats["yield_nulls"]
     results.append(
         ValidationResult(
             check_name="yield_no_nulls",
@@ -79,7 +94,7 @@ def validate_solar_data(df: pl.DataFrame) -> DataQualityReport:
     )
 
     # Check 3: Yield values are non-negative
-    negative_count = df.filter(pl.col("Yield(Wh)") < 0).height
+    negative_count = stats["yield_negative"]
     results.append(
         ValidationResult(
             check_name="yield_non_negative",
@@ -92,9 +107,8 @@ def validate_solar_data(df: pl.DataFrame) -> DataQualityReport:
     )
 
     # Check 4: Date column has valid format
-    try:
-        # Check if dates can be parsed (basic validation)
-        date_nulls = df["Date"].null_count()
+    if has_date:
+        date_nulls = stats["date_nulls"]
         results.append(
             ValidationResult(
                 check_name="date_format_valid",
@@ -105,20 +119,18 @@ def validate_solar_data(df: pl.DataFrame) -> DataQualityReport:
                 rows_affected=date_nulls,
             )
         )
-    except Exception as e:
+    else:
         results.append(
             ValidationResult(
                 check_name="date_format_valid",
                 passed=False,
-                message=f"Date validation error: {e}",
+                message="Date validation error: column 'Date' not found",
             )
         )
 
     # Check 5: Battery voltage is within reasonable range (10-16V typical for 12V system)
-    if "Min. battery voltage(V)" in df.columns:
-        out_of_range = df.filter(
-            (pl.col("Min. battery voltage(V)") < 10) | (pl.col("Min. battery voltage(V)") > 16)
-        ).height
+    if has_battery:
+        out_of_range = stats["battery_oor"]
         results.append(
             ValidationResult(
                 check_name="battery_voltage_range",
@@ -1,5 +1,6 @@
 """Pydantic models for solar CSV ingestion and validation."""
 
+import polars as pl
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
@@ -60,6 +61,48 @@ class SolarRecord(BaseModel):
         return v
 
 
+# Column-wise counterpart of SolarRecord, used to read and validate whole CSVs at once
+SOLAR_SCHEMA = pl.Schema(
+    {
+        "Days ago": pl.Int64,
+        "Date": pl.String,
+        "Yield(Wh)": pl.Float64,
+        "Consumption(Wh)": pl.Float64,
+        "Max. PV power(W)": pl.Float64,
+        "Max. PV voltage(V)": pl.Float64,
+        "Min. battery voltage(V)": pl.Float64,
+        "Max. battery voltage(V)": pl.Float64,
+        "Time in bulk(m)": pl.Int64,
+        "Time in absorption(m)": pl.Int64,
+        "Time in float(m)": pl.Int64,
+        "Last error": pl.Int64,
+        "2nd last error": pl.Int64,
+        "3rd last error": pl.Int64,
+        "4th last error": pl.Int64,
+    }
+)
+
+# Columns that SolarRecord constrains with ge=0
+NON_NEGATIVE_COLUMNS = (
+    "Yield(Wh)",
+    "Consumption(Wh)",
+    "Max. PV power(W)",
+    "Max. PV voltage(V)",
+    "Min. battery voltage(V)",
+    "Max. battery voltage(V)",
+    "Time in bulk(m)",
+    "Time in absorption(m)",
+    "Time in float(m)",
+)
+
+DATE_FORMAT = "%m/%d/%y"
+
+# Schema of the frames SolarPipeline returns, with Date parsed from DATE_FORMAT
+SOLAR_FRAME_SCHEMA = pl.Schema(
+    {name: pl.Date() if name == "Date" else dtype for name, dtype in SOLAR_SCHEMA.items()}
+)
+
+
 class SolarSummary(BaseModel):
     """Model for pipeline summary statistics."""
 
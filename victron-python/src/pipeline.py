@@ -1,11 +1,142 @@
 """Main data pipeline for solar CSV ingestion and processing using Polars."""
 
+import functools
+import os
+from collections.abc import Sequence
+from datetime import datetime
 from pathlib import Path
 
 import polars as pl
 from loguru import logger
 
-from src.models import SolarSummary
+from src.models import (
+    DATE_FORMAT,
+    NON_NEGATIVE_COLUMNS,
+    SOLAR_FRAME_SCHEMA,
+    SOLAR_SCHEMA,
+    SolarSummary,
+)
+
+# Converts the MM/DD/YY strings read from CSV into a Date column; unparseable dates become null
+_PARSE_DATE = pl.col("Date").str.to_date(DATE_FORMAT, strict=False)
+
+
+def _validate_frame(df: pl.DataFrame) -> None:
+    """Apply SolarRecord's field constraints to whole columns in one pass.
+
+    Columns missing from a projected frame are skipped.
+
+    Args:
+        df: DataFrame read with SOLAR_SCHEMA
+
+    Raises:
+        ValueError: If any date is not MM/DD/YY or a non-negative column holds negatives
+    """
+    exprs = [(pl.col(col) < 0).any().alias(col) for col in NON_NEGATIVE_COLUMNS if col in df]
+    if "Date" in df:
+        exprs.append(
+            pl.col("Date")
+            .str.strptime(pl.Date, DATE_FORMAT, strict=False)
+            .is_null()
+            .sum()
+            .alias("invalid_dates")
+        )
+    if not exprs:
+        return
+    checks = df.select(exprs).row(0, named=True)
+
+    invalid_dates = checks.pop("invalid_dates", 0)
+    if invalid_dates:
+        raise ValueError(f"Found {invalid_dates} dates not in MM/DD/YY format")
+
+    negative_columns = [col for col, has_negative in checks.items() if has_negative]
+    if negative_columns:
+        raise ValueError(f"Negative values in columns: {negative_columns}")
+
+
+def _source_stamp(mtime_ns: int, size: int) -> dict[str, str]:
+    """Parquet key-value metadata identifying the CSV version a sidecar was built from."""
+    return {"source_mtime_ns": str(mtime_ns), "source_size": str(size)}
+
+
+def _fresh_sidecar(csv_path: Path) -> Path | None:
+    """Return the Parquet copy of a CSV if it was built from this exact CSV version.
+
+    The sidecar must record the CSV's current mtime_ns and size and have
+    SOLAR_FRAME_SCHEMA; comparing mtimes alone would miss a CSV replaced by an older file.
+    """
+    sidecar = csv_path.with_suffix(".parquet")
+    try:
+        stat = csv_path.stat()
+        metadata = pl.read_parquet_metadata(sidecar)
+        stamp = _source_stamp(stat.st_mtime_ns, stat.st_size)
+        if any(metadata.get(key) != value for key, value in stamp.items()):
+            return None
+        if dict(pl.read_parquet_schema(sidecar)) != dict(SOLAR_FRAME_SCHEMA):
+            return None
+    except (OSError, pl.exceptions.PolarsError):
+        return None
+    return sidecar
+
+
+def _write_sidecar(df: pl.DataFrame, csv_path: Path, mtime_ns: int, size: int) -> None:
+    """Save a validated frame next to its CSV so later loads can skip CSV parsing.
+
+    mtime_ns and size describe the CSV version df was read from and are stored in the
+    sidecar's metadata for _fresh_sidecar.
+    """
+    sidecar = csv_path.with_suffix(".parquet")
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        df.write_parquet(
+            tmp,
+            compression="zstd",
+            statistics=True,
+            metadata=_source_stamp(mtime_ns, size),
+        )
+        os.replace(tmp, sidecar)
+    except OSError as e:
+        tmp.unlink(missing_ok=True)
+        logger.warning(f"Could not write Parquet sidecar {sidecar}: {e}")
+
+
+@functools.lru_cache(maxsize=8)
+def _read_solar_csv(
+    path: str, mtime_ns: int, size: int, columns: tuple[str, ...] | None = None
+) -> pl.DataFrame:
+    """Read and validate a solar CSV, memoized per file version and column projection.
+
+    mtime_ns and size only serve as cache key, so an edited file is parsed again. A fresh
+    Parquet sidecar is read instead of the CSV; otherwise one is written after validating
+    a full (unprojected) read. Dates are parsed and rows are returned oldest first, i.e.
+    sorted by "Days ago" descending.
+
+    Raises:
+        ValueError: If the CSV cannot be parsed, is empty, or fails validation
+    """
+    csv_path = Path(path)
+    sidecar = _fresh_sidecar(csv_path)
+    if sidecar is not None:
+        return pl.read_parquet(sidecar, columns=list(columns) if columns is not None else None)
+
+    lf = pl.scan_csv(csv_path, schema=SOLAR_SCHEMA).sort("Days ago", descending=True)
+    if columns is not None:
+        lf = lf.select(columns)
+    df = lf.collect()
+    if df.height == 0:
+        raise ValueError(f"CSV file is empty: {path}")
+
+    _validate_frame(df)
+    if "Date" in df:
+        df = df.with_columns(_PARSE_DATE)
+    if columns is None:
+        _write_sidecar(df, csv_path, mtime_ns, size)
+    return df
+
+
+def clear_cache() -> None:
+    """Drop all DataFrames memoized by SolarPipeline.load()."""
+    _read_solar_csv.cache_clear()
 
 
 class SolarPipeline:
@@ -24,26 +155,74 @@ class SolarPipeline:
         if not self.csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {self.csv_path}")
 
-        self.df: pl.DataFrame | None = None
+        self._df: pl.DataFrame | None = None
+        self.lf: pl.LazyFrame | None = None
+        self._summary: SolarSummary | None = None
         logger.info(f"Initialized SolarPipeline with {self.csv_path}")
 
-    def load(self) -> pl.DataFrame:
+    @property
+    def df(self) -> pl.DataFrame | None:
+        """The loaded data, or None before load()."""
+        return self._df
+
+    @df.setter
+    def df(self, df: pl.DataFrame | None) -> None:
+        # Any new frame, from load() or assigned directly, invalidates the cached summary
+        self._df = df
+        self._summary = None
+
+    def load_lazy(self) -> pl.LazyFrame:
+        """Return a lazy scan of the solar CSV.
+
+        Queries built on the scan only parse the columns and rows they use. A fresh Parquet
+        sidecar written by load() is scanned in place of the CSV. Rows are ordered oldest
+        first and Date is parsed as in load(), but no validation is applied.
+
+        Returns:
+            LazyFrame over the solar data
+        """
+        if self.lf is None:
+            sidecar = _fresh_sidecar(self.csv_path)
+            self.lf = (
+                pl.scan_parquet(sidecar)
+                if sidecar is not None
+                else pl.scan_csv(self.csv_path, schema=SOLAR_SCHEMA)
+                .sort("Days ago", descending=True)
+                .with_columns(_PARSE_DATE)
+            )
+        return self.lf
+
+    def _lazy_frame(self) -> pl.LazyFrame:
+        """Return the loaded data as a LazyFrame, falling back to a CSV scan."""
+        return self.df.lazy() if self.df is not None else self.load_lazy()
+
+    def load(self, columns: Sequence[str] | None = None) -> pl.DataFrame:
         """Load the solar CSV data into a Polars DataFrame.
 
+        Parsed frames are shared between pipelines reading the same unchanged file. Rows are
+        in chronological order (oldest first).
+
+        Args:
+            columns: Optional subset of columns to parse; the others are skipped by the CSV
+                reader. summarize() needs its aggregated columns to be included.
+
         Returns:
             DataFrame containing the solar data
 
         Raises:
-            ValueError: If the CSV cannot be parsed or is empty
+            ValueError: If the CSV cannot be parsed, is empty, or fails validation
         """
         try:
-            self.df = pl.read_csv(self.csv_path, try_parse_dates=True)
-            logger.info(f"Loaded {self.df.height} rows from {self.csv_path}")
-
-            if self.df.height == 0:
-                raise ValueError(f"CSV file is empty: {self.csv_path}")
-
-            return self.df
+            stat = self.csv_path.stat()
+            df = _read_solar_csv(
+                str(self.csv_path.resolve()),
+                stat.st_mtime_ns,
+                stat.st_size,
+                tuple(columns) if columns is not None else None,
+            )
+            self.df = df
+            logger.info(f"Loaded {df.height} rows from {self.csv_path}")
+            return df
         except Exception as e:
             logger.error(f"Failed to load CSV: {e}")
             raise
@@ -51,35 +230,38 @@ class SolarPipeline:
     def summarize(self) -> SolarSummary:
         """Return a summary of solar usage statistics.
 
+        All aggregates are computed in one lazy query. If the data hasn't been loaded yet,
+        the CSV is scanned directly so only the summarized columns are parsed. The result is
+        cached until the next load() or assignment to df.
+
         Returns:
             SolarSummary object with aggregated statistics
 
         Raises:
-            RuntimeError: If data hasn't been loaded yet
+            ValueError: If the CSV has no data rows
         """
-        if self.df is None:
-            self.load()
-
-        if self.df is None:
-            raise RuntimeError("Failed to load data")
-
-        df = self.df
-        total_yield_wh = float(df["Yield(Wh)"].sum())  # type: ignore[arg-type]
-        max_pv_power_w = float(df["Max. PV power(W)"].max())  # type: ignore[arg-type]
-        max_pv_voltage_v = float(df["Max. PV voltage(V)"].max())  # type: ignore[arg-type]
-        min_battery_voltage_v = float(df["Min. battery voltage(V)"].min())  # type: ignore[arg-type]
-        max_battery_voltage_v = float(df["Max. battery voltage(V)"].max())  # type: ignore[arg-type]
-        total_days = int(df.height)
-
-        logger.debug(f"Generated summary with {total_days} days")
-        return SolarSummary(
-            total_yield_wh=total_yield_wh,
-            max_pv_power_w=max_pv_power_w,
-            max_pv_voltage_v=max_pv_voltage_v,
-            min_battery_voltage_v=min_battery_voltage_v,
-            max_battery_voltage_v=max_battery_voltage_v,
-            total_days=total_days,
+        if self._summary is not None:
+            return self._summary
+
+        row = (
+            self._lazy_frame()
+            .select(
+                pl.col("Yield(Wh)").sum().alias("total_yield_wh"),
+                pl.col("Max. PV power(W)").max().alias("max_pv_power_w"),
+                pl.col("Max. PV voltage(V)").max().alias("max_pv_voltage_v"),
+                pl.col("Min. battery voltage(V)").min().alias("min_battery_voltage_v"),
+                pl.col("Max. battery voltage(V)").max().alias("max_battery_voltage_v"),
+                pl.len().alias("total_days"),
+            )
+            .collect()
+            .row(0, named=True)
         )
+        if row["total_days"] == 0:
+            raise ValueError(f"CSV file is empty: {self.csv_path}")
+
+        logger.debug(f"Generated summary with {row['total_days']} days")
+        self._summary = SolarSummary(**row)
+        return self._summary
 
     def filter_by_date(self, start: str, end: str) -> pl.DataFrame:
         """Filter records between two dates (inclusive).
@@ -88,19 +270,22 @@ class SolarPipeline:
             start: Start date in MM/DD/YY format
             end: End date in MM/DD/YY format
 
+        The bounds are parsed once and compared against the Date column natively. The
+        predicate runs on the loaded frame if there is one; otherwise it is pushed down into
+        the CSV scan.
+
         Returns:
             Filtered DataFrame
 
         Raises:
-            RuntimeError: If data hasn't been loaded yet
+            ValueError: If start or end is not in MM/DD/YY format
         """
-        if self.df is None:
-            self.load()
-
-        if self.df is None:
-            raise RuntimeError("Failed to load data")
-
-        mask = (self.df["Date"] >= start) & (self.df["Date"] <= end)
-        filtered = self.df.filter(mask)
+        start_date = datetime.strptime(start, DATE_FORMAT).date()
+        end_date = datetime.strptime(end, DATE_FORMAT).date()
+        filtered = (
+            self._lazy_frame()
+            .filter(pl.col("Date").is_between(start_date, end_date, closed="both"))
+            .collect()
+        )
         logger.info(f"Filtered {filtered.height} rows between {start} and {end}")
         return filtered
@@ -1,15 +1,46 @@
 """Comprehensive visualization utilities for Victron MPPT solar charge controller analysis."""
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
 import polars as pl
 from loguru import logger
-from matplotlib.figure import Figure
-from matplotlib.gridspec import GridSpec
 
+# matplotlib is imported inside the plotting functions so that importing this module (e.g.
+# during test collection) doesn't pay for pyplot and its font cache
+if TYPE_CHECKING:
+    import numpy as np
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
-def create_comprehensive_dashboard(df: pl.DataFrame, save_path: str | Path | None = None) -> Figure:
+
+# Upper bound on markers drawn per line; longer histories get subsampled markers
+_MAX_MARKERS = 100
+
+
+def _markevery(n_points: int) -> int:
+    """Return the marker stride that keeps a line of n_points within _MAX_MARKERS markers."""
+    return max(1, -(-n_points // _MAX_MARKERS))
+
+
+def _line_plot_axes(ax: "Axes | None") -> tuple["Figure", "Axes"]:
+    """Return the figure and axes for a line plot: ax's own figure, or a new 12x6 one."""
+    import matplotlib.pyplot as plt
+
+    if ax is not None:
+        return ax.get_figure(), ax  # type: ignore[return-value]
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    fig.subplots_adjust(left=0.08, right=0.97, top=0.93, bottom=0.2)
+    return fig, ax
+
+
+def create_comprehensive_dashboard(
+    df: pl.DataFrame,
+    save_path: str | Path | None = None,
+    fig: "Figure | None" = None,
+    close_after_save: bool = False,
+) -> "Figure | None":
     """Create a comprehensive solar system performance dashboard.
 
     This multi-panel dashboard provides key insights for understanding:
@@ -22,27 +53,71 @@ def create_comprehensive_dashboard(df: pl.DataFrame, save_path: str | Path | Non
     Args:
         df: DataFrame containing Victron MPPT history data
         save_path: Optional path to save the dashboard
+        fig: Optional figure from a previous call to clear and draw into, so batch renders
+            reuse one canvas instead of allocating a new one each time
+        close_after_save: Close the figure once it has been saved to save_path, releasing
+            its canvas for long-running batch jobs
 
     Returns:
-        matplotlib Figure object with comprehensive dashboard
+        matplotlib Figure object with comprehensive dashboard, or None if it was closed
+        after saving
 
     Raises:
         ValueError: If required columns are missing
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.gridspec import GridSpec
+    from matplotlib.lines import Line2D
+
     logger.info("Creating comprehensive solar dashboard")
 
-    # Sort by Days ago (descending = oldest first, since days ago is inverse chronological)
-    df = df.sort("Days ago", descending=True)
-    dates = df["Date"].to_list()
+    # Sort by Days ago (descending = oldest first, since days ago is inverse chronological).
+    # Frames from SolarPipeline.load() are already in this order.
+    if not df["Days ago"].is_sorted(descending=True):
+        df = df.sort("Days ago", descending=True)
+
+    # Derived per-day columns: minutes spent charging and average charging power (Wh per hour)
+    charge_time = pl.col("Time in bulk(m)") + pl.col("Time in absorption(m)")
+    df = df.with_columns(
+        charge_time.alias("charge_time"),
+        pl.when(charge_time > 0)
+        .then(pl.col("Yield(Wh)") / (charge_time / 60))
+        .otherwise(0)
+        .alias("efficiency"),
+        pl.col("Yield(Wh)").cum_sum().alias("cum_yield"),
+    )
+    dates = df["Date"].to_numpy()
+    markevery = _markevery(df.height)
+
+    # Scalar statistics for the summary and insight panels, reduced in a single pass
+    yield_wh = pl.col("Yield(Wh)")
+    stats = df.select(
+        yield_wh.sum().alias("total_yield"),
+        yield_wh.mean().alias("avg_yield"),
+        pl.col("Max. PV power(W)").max().alias("max_power"),
+        pl.col("Max. battery voltage(V)").mean().alias("avg_max_voltage"),
+        pl.col("Min. battery voltage(V)").min().alias("min_min_voltage"),
+        (yield_wh < yield_wh.mean() * 0.5).sum().alias("days_low_production"),
+        (yield_wh > yield_wh.mean()).sum().alias("days_good_production"),
+        pl.col("Time in bulk(m)").mean().alias("avg_bulk_time"),
+        pl.col("Time in absorption(m)").mean().alias("avg_absorption_time"),
+        (pl.col("Min. battery voltage(V)") < 12.2).sum().alias("low_battery_days"),
+    ).row(0, named=True)
+    avg_yield = stats["avg_yield"]
 
     # Create figure with custom layout
-    fig = plt.figure(figsize=(20, 12))
-    gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
+    if fig is None:
+        fig = plt.figure(figsize=(20, 12))
+    else:
+        fig.clear()
+    # Fixed margins instead of bbox_inches="tight", which renders the figure twice on save
+    gs = GridSpec(
+        3, 3, figure=fig, left=0.04, right=0.98, top=0.93, bottom=0.1, hspace=0.35, wspace=0.3
+    )
 
     # Panel 1: Daily Energy Yield (top left, spans 2 columns)
     ax1 = fig.add_subplot(gs[0, :2])
-    yields = df["Yield(Wh)"].to_list()
-    avg_yield = df["Yield(Wh)"].mean()
+    yields = df["Yield(Wh)"].to_numpy()
     ax1.bar(dates, yields, alpha=0.7, color="gold", edgecolor="orange", linewidth=1.5)
     ax1.axhline(
         avg_yield,
@@ -60,10 +135,10 @@ def create_comprehensive_dashboard(df: pl.DataFrame, save_path: str | Path | Non
     # Panel 2: Summary Statistics (top right)
     ax2 = fig.add_subplot(gs[0, 2])
     ax2.axis("off")
-    total_yield = df["Yield(Wh)"].sum()
-    max_power = df["Max. PV power(W)"].max()
-    avg_max_voltage = df["Max. battery voltage(V)"].mean()
-    min_min_voltage = df["Min. battery voltage(V)"].min()
+    total_yield = stats["total_yield"]
+    max_power = stats["max_power"]
+    avg_max_voltage = stats["avg_max_voltage"]
+    min_min_voltage = stats["min_min_voltage"]
     days = df.height
 
     summary_text = f"""
@@ -93,36 +168,83 @@ def create_comprehensive_dashboard(df: pl.DataFrame, save_path: str | Path | Non
 
     # Panel 3: Battery Voltage Range (middle left)
     ax3 = fig.add_subplot(gs[1, 0])
-    min_v = df["Min. battery voltage(V)"].to_list()
-    max_v = df["Max. battery voltage(V)"].to_list()
+    min_v = df["Min. battery voltage(V)"].to_numpy()
+    max_v = df["Max. battery voltage(V)"].to_numpy()
     ax3.fill_between(
         range(len(dates)), min_v, max_v, alpha=0.3, color="green", label="Voltage Range"
     )
     ax3.plot(
-        min_v, "v-", color="darkred", linewidth=2, markersize=4, label="Min (Depth of Discharge)"
+        min_v,
+        "v-",
+        color="darkred",
+        linewidth=2,
+        markersize=4,
+        markevery=markevery,
+        label="Min (Depth of Discharge)",
+    )
+    ax3.plot(
+        max_v,
+        "^-",
+        color="darkgreen",
+        linewidth=2,
+        markersize=4,
+        markevery=markevery,
+        label="Max (Charged)",
+    )
+
+    # Charger setpoints drawn as one full-width LineCollection, with proxy legend entries
+    setpoints = {
+        "Absorption setpoint": (14.4, "blue"),
+        "Float setpoint": (13.5, "orange"),
+        "Low battery warning": (12.0, "red"),
+    }
+    ax3.hlines(
+        [voltage for voltage, _ in setpoints.values()],
+        0,
+        1,
+        transform=ax3.get_yaxis_transform(),
+        colors=[color for _, color in setpoints.values()],
+        linestyles="--",
+        alpha=0.5,
     )
-    ax3.plot(max_v, "^-", color="darkgreen", linewidth=2, markersize=4, label="Max (Charged)")
-    ax3.axhline(14.4, color="blue", linestyle="--", alpha=0.5, label="Absorption setpoint")
-    ax3.axhline(13.5, color="orange", linestyle="--", alpha=0.5, label="Float setpoint")
-    ax3.axhline(12.0, color="red", linestyle="--", alpha=0.5, label="Low battery warning")
+    handles, _ = ax3.get_legend_handles_labels()
+    handles += [
+        Line2D([], [], color=color, linestyle="--", alpha=0.5, label=label)
+        for label, (_, color) in setpoints.items()
+    ]
     ax3.set_title("Battery Voltage Behavior", fontsize=12, fontweight="bold")
     ax3.set_ylabel("Voltage (V)", fontsize=10)
     ax3.set_xlabel("Days", fontsize=10)
-    ax3.legend(fontsize=8, loc="lower left")
+    ax3.legend(handles=handles, fontsize=8, loc="lower left")
     ax3.grid(True, alpha=0.3)
 
     # Panel 4: Solar Panel Performance (middle center)
     ax4 = fig.add_subplot(gs[1, 1])
-    pv_power = df["Max. PV power(W)"].to_list()
-    pv_voltage = df["Max. PV voltage(V)"].to_list()
+    pv_power = df["Max. PV power(W)"].to_numpy()
+    pv_voltage = df["Max. PV voltage(V)"].to_numpy()
     ax4_twin = ax4.twinx()
 
-    line1 = ax4.plot(pv_power, "o-", color="orange", linewidth=2, markersize=5, label="Peak Power")
+    line1 = ax4.plot(
+        pv_power,
+        "o-",
+        color="orange",
+        linewidth=2,
+        markersize=5,
+        markevery=markevery,
+        label="Peak Power",
+    )
     ax4.set_ylabel("Peak PV Power (W)", fontsize=10, color="orange")
     ax4.tick_params(axis="y", labelcolor="orange")
 
     line2 = ax4_twin.plot(
-        pv_voltage, "s-", color="blue", linewidth=2, markersize=4, alpha=0.7, label="Peak Voltage"
+        pv_voltage,
+        "s-",
+        color="blue",
+        linewidth=2,
+        markersize=4,
+        markevery=markevery,
+        alpha=0.7,
+        label="Peak Voltage",
     )
     ax4_twin.set_ylabel("Peak PV Voltage (V)", fontsize=10, color="blue")
     ax4_twin.tick_params(axis="y", labelcolor="blue")
@@ -138,17 +260,18 @@ def create_comprehensive_dashboard(df: pl.DataFrame, save_path: str | Path | Non
 
     # Panel 5: Charging Phase Distribution (middle right)
     ax5 = fig.add_subplot(gs[1, 2])
-    bulk_time = df["Time in bulk(m)"].to_list()
-    absorption_time = df["Time in absorption(m)"].to_list()
-    float_time = df["Time in float(m)"].to_list()
+    bulk_time = df["Time in bulk(m)"].to_numpy()
+    absorption_time = df["Time in absorption(m)"].to_numpy()
+    float_time = df["Time in float(m)"].to_numpy()
 
     x = range(len(dates))
     ax5.bar(x, bulk_time, label="Bulk", color="red", alpha=0.7)
     ax5.bar(x, absorption_time, bottom=bulk_time, label="Absorption", color="yellow", alpha=0.7)
 
     # Stack float on top
-    bulk_abs = [b + a for b, a in zip(bulk_time, absorption_time, strict=False)]
-    ax5.bar(x, float_time, bottom=bulk_abs, label="Float", color="green", alpha=0.7)
+    ax5.bar(
+        x, float_time, bottom=df["charge_time"].to_numpy(), label="Float", color="green", alpha=0.7
+    )
 
     ax5.set_title("MPPT Charging Phases", fontsize=12, fontweight="bold")
     ax5.set_ylabel("Time (minutes)", fontsize=10)
@@ -158,8 +281,15 @@ def create_comprehensive_dashboard(df: pl.DataFrame, save_path: str | Path | Non
 
     # Panel 6: Cumulative Energy Production (bottom left)
     ax6 = fig.add_subplot(gs[2, 0])
-    cumulative_yield = df["Yield(Wh)"].cum_sum().to_list()
-    ax6.plot(cumulative_yield, linewidth=3, color="darkgreen", marker="o", markersize=3)
+    cumulative_yield = df["cum_yield"].to_numpy()
+    ax6.plot(
+        cumulative_yield,
+        linewidth=3,
+        color="darkgreen",
+        marker="o",
+        markersize=3,
+        markevery=markevery,
+    )
     ax6.fill_between(range(len(cumulative_yield)), cumulative_yield, alpha=0.2, color="green")
     ax6.set_title("Cumulative Energy Production", fontsize=12, fontweight="bold")
     ax6.set_ylabel("Total Energy (Wh)", fontsize=10)
@@ -168,18 +298,20 @@ def create_comprehensive_dashboard(df: pl.DataFrame, save_path: str | Path | Non
 
     # Panel 7: Efficiency Metrics (bottom center)
     ax7 = fig.add_subplot(gs[2, 1])
-    # Calculate charging efficiency: yield vs time spent charging
-    total_charge_time = [b + a for b, a in zip(bulk_time, absorption_time, strict=False)]
-    efficiency = [
-        y / (t / 60) if t > 0 else 0 for y, t in zip(yields, total_charge_time, strict=False)
-    ]  # Wh per hour
-
-    ax7.plot(efficiency, "o-", color="purple", linewidth=2, markersize=5)
+    avg_efficiency = df["efficiency"].mean()
+    ax7.plot(
+        df["efficiency"].to_numpy(),
+        "o-",
+        color="purple",
+        linewidth=2,
+        markersize=5,
+        markevery=markevery,
+    )
     ax7.axhline(
-        sum(efficiency) / len(efficiency),
+        avg_efficiency,  # type: ignore[arg-type]
         color="red",
         linestyle="--",
-        label=f"Avg: {sum(efficiency) / len(efficiency):.1f} W",
+        label=f"Avg: {avg_efficiency:.1f} W",
     )
     ax7.set_title("Charging Efficiency", fontsize=12, fontweight="bold")
     ax7.set_ylabel("Average Power (W)", fontsize=10)
@@ -192,11 +324,11 @@ def create_comprehensive_dashboard(df: pl.DataFrame, save_path: str | Path | Non
     ax8.axis("off")
 
     # Calculate insights
-    days_low_production = sum(1 for y in yields if y < avg_yield * 0.5)  # type: ignore[operator,misc]
-    days_good_production = sum(1 for y in yields if y > avg_yield)  # type: ignore[operator,misc]
-    avg_bulk_time = sum(bulk_time) / len(bulk_time)
-    avg_absorption_time = sum(absorption_time) / len(absorption_time)
-    low_battery_days = sum(1 for v in min_v if v < 12.2)  # type: ignore[operator,misc]
+    days_low_production = stats["days_low_production"]
+    days_good_production = stats["days_good_production"]
+    avg_bulk_time = stats["avg_bulk_time"]
+    avg_absorption_time = stats["avg_absorption_time"]
+    low_battery_days = stats["low_battery_days"]
 
     insights_text = f"""
     KEY INSIGHTS
@@ -238,20 +370,27 @@ def create_comprehensive_dashboard(df: pl.DataFrame, save_path: str | Path | Non
 
     if save_path:
         save_path = Path(save_path)
-        fig.savefig(save_path, dpi=150, bbox_inches="tight")
+        fig.savefig(save_path, dpi=150)
         logger.info(f"Saved comprehensive dashboard to {save_path}")
+        if close_after_save:
+            plt.close(fig)
+            return None
     else:
         plt.show()
 
     return fig
 
 
-def plot_yield_over_time(df: pl.DataFrame, save_path: str | Path | None = None) -> Figure:
+def plot_yield_over_time(
+    df: pl.DataFrame, save_path: str | Path | None = None, ax: "Axes | None" = None
+) -> "Figure":
     """Plot daily solar yield over time.
 
     Args:
         df: DataFrame containing solar data with Date and Yield(Wh) columns
         save_path: Optional path to save the figure
+        ax: Optional existing axes to draw into instead of creating a new figure; anything
+            already on it is kept, and the layout of its figure is left to the caller
 
     Returns:
         matplotlib Figure object
@@ -264,21 +403,52 @@ def plot_yield_over_time(df: pl.DataFrame, save_path: str | Path | None = None)
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
-    dates = df["Date"].to_list()
-    yields = df["Yield(Wh)"].to_list()
+    return plot_yield_over_time_np(
+        df["Date"].to_numpy(), df["Yield(Wh)"].to_numpy(), save_path=save_path, ax=ax
+    )
 
-    fig, ax = plt.subplots(figsize=(12, 6))
-    ax.plot(dates, yields, marker="o", linestyle="-", linewidth=2, markersize=4)
+
+def plot_yield_over_time_np(
+    dates: "np.ndarray",
+    yields: "np.ndarray",
+    save_path: str | Path | None = None,
+    ax: "Axes | None" = None,
+) -> "Figure":
+    """Plot daily solar yield over time from pre-extracted arrays.
+
+    Lets callers that plot the same data repeatedly extract the columns once.
+
+    Args:
+        dates: Dates of the readings
+        yields: Daily yield in Wh, aligned with dates
+        save_path: Optional path to save the figure
+        ax: Optional existing axes to draw into instead of creating a new figure; anything
+            already on it is kept, and the layout of its figure is left to the caller
+
+    Returns:
+        matplotlib Figure object
+    """
+    import matplotlib.pyplot as plt
+
+    fig, ax = _line_plot_axes(ax)
+    ax.plot(
+        dates,
+        yields,
+        marker="o",
+        linestyle="-",
+        linewidth=2,
+        markersize=4,
+        markevery=_markevery(len(dates)),
+    )
     ax.set_title("Daily Solar Yield Over Time", fontsize=14, fontweight="bold")
     ax.set_xlabel("Date", fontsize=12)
     ax.set_ylabel("Yield (Wh)", fontsize=12)
     ax.tick_params(axis="x", rotation=45)
     ax.grid(True, alpha=0.3)
-    fig.tight_layout()
 
     if save_path:
         save_path = Path(save_path)
-        fig.savefig(save_path, dpi=150, bbox_inches="tight")
+        fig.savefig(save_path, dpi=150)
         logger.info(f"Saved visualization to {save_path}")
     else:
         plt.show()
@@ -286,12 +456,16 @@ def plot_yield_over_time(df: pl.DataFrame, save_path: str | Path | None = None)
     return fig
 
 
-def plot_battery_voltage(df: pl.DataFrame, save_path: str | Path | None = None) -> Figure:
+def plot_battery_voltage(
+    df: pl.DataFrame, save_path: str | Path | None = None, ax: "Axes | None" = None
+) -> "Figure":
     """Plot battery voltage range over time.
 
     Args:
         df: DataFrame containing solar data with battery voltage columns
         save_path: Optional path to save the figure
+        ax: Optional existing axes to draw into instead of creating a new figure; anything
+            already on it is kept, and the layout of its figure is left to the caller
 
     Returns:
         matplotlib Figure object
@@ -299,18 +473,37 @@ def plot_battery_voltage(df: pl.DataFrame, save_path: str | Path | None = None)
     Raises:
         ValueError: If required columns are missing
     """
+    import matplotlib.pyplot as plt
+
     required_cols = ["Date", "Min. battery voltage(V)", "Max. battery voltage(V)"]
     missing = [col for col in required_cols if col not in df.columns]
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
-    dates = df["Date"].to_list()
-    min_voltage = df["Min. battery voltage(V)"].to_list()
-    max_voltage = df["Max. battery voltage(V)"].to_list()
-
-    fig, ax = plt.subplots(figsize=(12, 6))
-    ax.plot(dates, min_voltage, label="Min Voltage", marker="v", linestyle="-", linewidth=2)
-    ax.plot(dates, max_voltage, label="Max Voltage", marker="^", linestyle="-", linewidth=2)
+    dates = df["Date"].to_numpy()
+    min_voltage = df["Min. battery voltage(V)"].to_numpy()
+    max_voltage = df["Max. battery voltage(V)"].to_numpy()
+
+    fig, ax = _line_plot_axes(ax)
+    markevery = _markevery(len(dates))
+    ax.plot(
+        dates,
+        min_voltage,
+        label="Min Voltage",
+        marker="v",
+        linestyle="-",
+        linewidth=2,
+        markevery=markevery,
+    )
+    ax.plot(
+        dates,
+        max_voltage,
+        label="Max Voltage",
+        marker="^",
+        linestyle="-",
+        linewidth=2,
+        markevery=markevery,
+    )
     ax.fill_between(dates, min_voltage, max_voltage, alpha=0.2)
     ax.set_title("Battery Voltage Range Over Time", fontsize=14, fontweight="bold")
     ax.set_xlabel("Date", fontsize=12)
@@ -318,11 +511,10 @@ def plot_battery_voltage(df: pl.DataFrame, save_path: str | Path | None = None)
     ax.tick_params(axis="x", rotation=45)
     ax.legend()
     ax.grid(True, alpha=0.3)
-    fig.tight_layout()
 
     if save_path:
         save_path = Path(save_path)
-        fig.savefig(save_path, dpi=150, bbox_inches="tight")
+        fig.savefig(save_path, dpi=150)
         logger.info(f"Saved visualization to {save_path}")
     else:
         plt.show()
@@ -332,5 +524,7 @@ def plot_battery_voltage(df: pl.DataFrame, save_path: str | Path | None = None)
 
 def close_all_figures() -> None:
     """Close all matplotlib figures to free memory."""
+    import matplotlib.pyplot as plt
+
     plt.close("all")
     logger.debug("Closed all matplotlib figures")
@@ -0,0 +1,82 @@
+"""Shared pytest fixtures."""
+
+import io
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+
+from src.pipeline import SolarPipeline
+
+# Must be set before matplotlib is first imported: a stable config dir lets the font cache
+# survive between runs, and a fixed backend skips backend autodetection
+os.environ.setdefault("MPLCONFIGDIR", str(Path(tempfile.gettempdir()) / "mplcache"))
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+# Sample data, resolved once so every test and cache key sees the same absolute path
+CSV_PATH = Path(os.environ.get("CSV", "../data/SolarHistory.csv")).resolve()
+
+
+@pytest.fixture(scope="session")
+def csv_path() -> Path:
+    """Absolute path of the sample CSV (overridable with the CSV environment variable)."""
+    return CSV_PATH
+
+
+@pytest.fixture(scope="session")
+def solar_pipeline(csv_path: Path) -> SolarPipeline:
+    """Pipeline over the sample CSV, loaded once per test session."""
+    pipeline = SolarPipeline(csv_path)
+    pipeline.load()
+    return pipeline
+
+
+@pytest.fixture(scope="session")
+def solar_df(solar_pipeline: SolarPipeline) -> pl.DataFrame:
+    """The loaded sample data shared by all tests."""
+    assert solar_pipeline.df is not None
+    return solar_pipeline.df
+
+
+@pytest.fixture(scope="session")
+def matplotlib_agg() -> None:
+    """Render with Agg and coarser line simplification, since tests only save figures.
+
+    A fixture rather than module-level code, so pipeline-only test runs never import
+    matplotlib.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg", force=True)
+    matplotlib.rcParams["path.simplify"] = True
+    matplotlib.rcParams["path.simplify_threshold"] = 1.0
+    matplotlib.rcParams["agg.path.chunksize"] = 10000
+
+
+@pytest.fixture
+def raw_savefig(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make Figure.savefig render to an in-memory RGBA buffer and write only a PNG signature.
+
+    The whole figure is still drawn, so the plotting code is exercised end to end; only
+    the PNG encoding is skipped.
+    """
+    from matplotlib.figure import Figure
+
+    real_savefig = Figure.savefig
+
+    def render_raw(
+        self: Figure, fname: str | os.PathLike[str], *args: object, **kwargs: object
+    ) -> None:
+        real_savefig(self, io.BytesIO(), *args, **{**kwargs, "format": "raw"})
+        Path(fname).write_bytes(b"\x89PNG\r\n\x1a\n")
+
+    monkeypatch.setattr(Figure, "savefig", render_raw)
+
+
+@pytest.fixture(scope="session")
+def yield_arrays(solar_df: pl.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """Date and Yield(Wh) columns of solar_df as NumPy arrays, extracted once."""
+    return solar_df["Date"].to_numpy(), solar_df["Yield(Wh)"].to_numpy()
@@ -58,6 +58,30 @@ def test_generate_cost_report_missing_columns():
         generate_cost_report(df)
 
 
+def test_generate_cost_report_lazy_frame():
+    """Test a LazyFrame produces the same report as the eager DataFrame."""
+    df = pl.DataFrame(
+        {
+            "Yield(Wh)": [100, 200, 150, 250],
+            "Consumption(Wh)": [50, 75, 100, 80],
+        }
+    )
+
+    assert generate_cost_report(df.lazy()) == generate_cost_report(df)
+
+
+def test_generate_cost_report_lazy_frame_missing_columns():
+    """Test the missing-column check also applies to a LazyFrame."""
+    lf = pl.LazyFrame(
+        {
+            "Yield(Wh)": [100, 200],
+        }
+    )
+
+    with pytest.raises(ValueError, match="must contain"):
+        generate_cost_report(lf)
+
+
 def test_format_cost_report():
     """Test cost report formatting."""
     df = pl.DataFrame(
@@ -1,14 +1,8 @@
-import os
-
 from src.data_quality import validate_solar_data
-from src.pipeline import SolarPipeline
 
 
-def test_data_quality():
-    csv_path = os.environ.get("CSV", "../data/SolarHistory.csv")
-    pipeline = SolarPipeline(csv_path)
-    df = pipeline.load()
-    report = validate_solar_data(df)
+def test_data_quality(solar_df):
+    report = validate_solar_data(solar_df)
 
     # Check that we ran all expected checks
     assert report.total_checks > 0
@@ -1,14 +1,10 @@
 """Initial test for SolarPipeline (TDD setup)."""
 
-import os
-
 from src.pipeline import SolarPipeline
 
 
-def test_pipeline_instantiation():
-    csv_path = os.environ.get("CSV", "../data/SolarHistory.csv")
-    pipeline = SolarPipeline(csv_path)
-    assert isinstance(pipeline, SolarPipeline)
+def test_pipeline_instantiation(solar_pipeline):
+    assert isinstance(solar_pipeline, SolarPipeline)
 
 
 # TODO: Update these tests to use the new SolarRecord model with actual CSV schema
@@ -1,28 +1,130 @@
 import os
+import shutil
+from datetime import date
 
-from src.pipeline import SolarPipeline
+import pytest
 
+from src.pipeline import SolarPipeline, clear_cache
 
-def test_pipeline_load_and_summary():
-    csv_path = os.environ.get("CSV", "../data/SolarHistory.csv")
-    pipeline = SolarPipeline(csv_path)
-    df = pipeline.load()
+
+def test_pipeline_load_and_summary(solar_pipeline, solar_df):
+    df = solar_df
     assert df.height > 0
 
     # Test that summarize returns a typed SolarSummary object
-    summary = pipeline.summarize()
+    summary = solar_pipeline.summarize()
     assert hasattr(summary, "total_yield_wh")
     assert hasattr(summary, "total_days")
     assert summary.total_yield_wh > 0
     assert summary.total_days == df.height
     assert summary.max_pv_power_w >= 0
     assert summary.min_battery_voltage_v > 0
+    assert solar_pipeline.summarize() is summary
+
+
+def test_pipeline_filter_by_date(solar_pipeline):
+    filtered = solar_pipeline.filter_by_date("10/10/25", "10/12/25")
+    assert filtered.height == 3
+    assert filtered["Date"].min() >= date(2025, 10, 10)
+    assert filtered["Date"].max() <= date(2025, 10, 12)
+
+
+def test_pipeline_load_is_memoized(csv_path):
+    df = SolarPipeline(csv_path).load()
+    assert SolarPipeline(csv_path).load() is df
+
+    clear_cache()
+    assert SolarPipeline(csv_path).load() is not df
+
+
+def test_pipeline_load_writes_parquet_sidecar(csv_path, tmp_path):
+    copied_path = tmp_path / "SolarHistory.csv"
+    shutil.copy(csv_path, copied_path)
+    df = SolarPipeline(copied_path).load()
+    assert copied_path.with_suffix(".parquet").exists()
+
+    clear_cache()
+    assert SolarPipeline(copied_path).load().equals(df)
+
+
+def test_pipeline_sidecar_ignored_for_replaced_csv(csv_path, tmp_path):
+    copied_path = tmp_path / "SolarHistory.csv"
+    shutil.copy(csv_path, copied_path)
+    assert SolarPipeline(copied_path).load().height == 31
+
+    # Replace the CSV with a shorter export whose mtime predates the sidecar
+    lines = csv_path.read_text().splitlines(keepends=True)
+    copied_path.write_text("".join(lines[:5]))
+    os.utime(copied_path, ns=(0, 0))
+
+    clear_cache()
+    assert SolarPipeline(copied_path).load().height == 4
+
+
+def test_pipeline_load_lazy_row_order(csv_path, tmp_path):
+    copied_path = tmp_path / "SolarHistory.csv"
+    shutil.copy(csv_path, copied_path)
+    from_csv = SolarPipeline(copied_path).load_lazy().collect()
 
+    SolarPipeline(copied_path).load()
+    from_parquet = SolarPipeline(copied_path).load_lazy().collect()
 
-def test_pipeline_filter_by_date():
-    csv_path = os.environ.get("CSV", "../data/SolarHistory.csv")
+    assert from_csv["Days ago"].is_sorted(descending=True)
+    assert from_csv.equals(from_parquet)
+
+
+def test_pipeline_load_column_projection(csv_path):
+    full = SolarPipeline(csv_path).load()
+    projected = SolarPipeline(csv_path).load(columns=["Date", "Yield(Wh)"])
+    assert projected.columns == ["Date", "Yield(Wh)"]
+    assert projected.equals(full.select("Date", "Yield(Wh)"))
+
+
+def _write_csv(csv_path, tmp_path, row):
+    """Write the sample CSV header followed by a single data row."""
+    header = csv_path.read_text().splitlines()[0]
+    path = tmp_path / "SolarHistory.csv"
+    path.write_text(f"{header}\n{row}\n")
+    return path
+
+
+def test_pipeline_load_rejects_negative_yield(csv_path, tmp_path):
+    path = _write_csv(
+        csv_path, tmp_path, "1,10/22/25,-60,0,8.00,43.48,13.67,14.50,159,1,516,0,0,0,0"
+    )
+    with pytest.raises(ValueError, match="Yield"):
+        SolarPipeline(path).load()
+
+
+def test_pipeline_load_rejects_bad_date(csv_path, tmp_path):
+    path = _write_csv(
+        csv_path, tmp_path, "1,2025-10-22,60,0,8.00,43.48,13.67,14.50,159,1,516,0,0,0,0"
+    )
+    with pytest.raises(ValueError, match="MM/DD/YY"):
+        SolarPipeline(path).load()
+
+
+def test_pipeline_load_validates_projected_columns_only(csv_path, tmp_path):
+    path = _write_csv(
+        csv_path, tmp_path, "1,10/22/25,60,-5,8.00,43.48,13.67,14.50,159,1,516,0,0,0,0"
+    )
+    df = SolarPipeline(path).load(columns=["Date", "Yield(Wh)"])
+    assert df.row(0) == (date(2025, 10, 22), 60)
+    with pytest.raises(ValueError, match="Consumption"):
+        SolarPipeline(path).load()
+
+
+def test_pipeline_summarize_empty_csv(csv_path, tmp_path):
+    path = tmp_path / "SolarHistory.csv"
+    path.write_text(csv_path.read_text().splitlines()[0] + "\n")
+    with pytest.raises(ValueError, match="CSV file is empty"):
+        SolarPipeline(path).summarize()
+
+
+def test_pipeline_summary_invalidated_by_df_assignment(csv_path):
     pipeline = SolarPipeline(csv_path)
-    pipeline.load()
-    filtered = pipeline.filter_by_date("10/10/25", "10/12/25")
-    assert all(filtered["Date"] >= "10/10/25")
-    assert all(filtered["Date"] <= "10/12/25")
+    df = pipeline.load()
+    assert pipeline.summarize().total_days == 31
+
+    pipeline.df = df.head(3)
+    assert pipeline.summarize().total_days == 3
@@ -1,51 +1,151 @@
 import os
+import subprocess
+import sys
+from pathlib import Path
+
+import polars as pl
+import pytest
 
-from src.pipeline import SolarPipeline
 from src.visualization import (
+    _MAX_MARKERS,
+    _markevery,
     close_all_figures,
     create_comprehensive_dashboard,
     plot_battery_voltage,
     plot_yield_over_time,
+    plot_yield_over_time_np,
 )
 
+pytestmark = pytest.mark.usefixtures("matplotlib_agg")
+
 
-def test_plot_yield_over_time(tmp_path):
-    csv_path = os.environ.get("CSV", "../data/SolarHistory.csv")
-    pipeline = SolarPipeline(csv_path)
-    df = pipeline.load()
-    save_path = tmp_path / "yield_plot.png"
+def assert_saved(fig, path):
+    """Assert that a plot function returned its figure and wrote path (one stat call)."""
+    assert fig is not None and path.is_file(), f"figure not saved to {path}"
 
-    fig = plot_yield_over_time(df, str(save_path))
-    assert save_path.exists()
-    assert fig is not None
 
-    # Clean up
+@pytest.fixture(autouse=True)
+def _close_figures():
+    """Close every figure after each test, even when an assertion fails."""
+    yield
     close_all_figures()
 
 
-def test_plot_battery_voltage(tmp_path):
-    csv_path = os.environ.get("CSV", "../data/SolarHistory.csv")
-    pipeline = SolarPipeline(csv_path)
-    df = pipeline.load()
-    save_path = tmp_path / "battery_plot.png"
+@pytest.fixture(scope="module")
+def _shared_ax(matplotlib_agg):
+    """One figure and axes shared by the line-plot tests in this module.
 
-    fig = plot_battery_voltage(df, str(save_path))
-    assert save_path.exists()
-    assert fig is not None
+    The figure is created outside pyplot, so _close_figures cannot close it between tests.
+    """
+    from matplotlib.figure import Figure
+
+    return Figure(figsize=(12, 6)).subplots()
+
+
+@pytest.fixture
+def reusable_ax(_shared_ax):
+    """The shared axes, cleared of the previous test's plot."""
+    _shared_ax.clear()
+    return _shared_ax
+
+
+@pytest.fixture(scope="module")
+def dashboard_df(solar_df):
+    """solar_df with floats downcast to Float32 for the dashboard tests.
+
+    The sample readings have at most two decimals, so Float32 draws the same dashboard from
+    half the float bytes.
+    """
+    return solar_df.with_columns(pl.col(pl.Float64).cast(pl.Float32))
+
+
+@pytest.mark.parametrize("n_points", [0, 1, 100, 101, 150, 199, 10_000])
+def test_markevery_caps_marker_count(n_points):
+    markers = len(range(0, n_points, _markevery(n_points)))
+    assert markers <= _MAX_MARKERS
+
+
+@pytest.mark.parametrize(
+    ("plot_fn", "columns", "filename"),
+    [
+        (plot_yield_over_time, ["Date", "Yield(Wh)"], "yield_plot.png"),
+        (
+            plot_battery_voltage,
+            ["Date", "Min. battery voltage(V)", "Max. battery voltage(V)"],
+            "battery_plot.png",
+        ),
+    ],
+)
+def test_plot_saves_figure(
+    plot_fn, columns, filename, solar_pipeline, tmp_path, raw_savefig, reusable_ax
+):
+    # Only parse the columns the plot uses
+    df = solar_pipeline.load_lazy().select(columns).collect()
+    save_path = tmp_path / filename
+
+    fig = plot_fn(df, str(save_path), ax=reusable_ax)
+    assert_saved(fig, save_path)
+    assert fig is reusable_ax.figure
 
-    # Clean up
-    close_all_figures()
 
+def test_plot_yield_over_time_np(yield_arrays, tmp_path, raw_savefig, reusable_ax):
+    dates, yields = yield_arrays
+    save_path = tmp_path / "yield_plot_np.png"
 
-def test_comprehensive_dashboard(tmp_path):
-    csv_path = os.environ.get("CSV", "../data/SolarHistory.csv")
-    pipeline = SolarPipeline(csv_path)
-    df = pipeline.load()
+    fig = plot_yield_over_time_np(dates, yields, str(save_path), ax=reusable_ax)
+    assert_saved(fig, save_path)
+
+
+def test_plot_yield_over_time_np_keeps_existing_lines(
+    yield_arrays, tmp_path, raw_savefig, reusable_ax
+):
+    dates, yields = yield_arrays
+    reusable_ax.plot(dates, yields * 2)
+
+    plot_yield_over_time_np(dates, yields, str(tmp_path / "overlay.png"), ax=reusable_ax)
+    assert len(reusable_ax.lines) == 2
+
+
+def test_comprehensive_dashboard(dashboard_df, tmp_path, raw_savefig):
     save_path = tmp_path / "dashboard.png"
 
-    fig = create_comprehensive_dashboard(df, str(save_path))
-    assert save_path.exists()
-    assert fig is not None
+    fig = create_comprehensive_dashboard(dashboard_df, str(save_path))
+    assert_saved(fig, save_path)
 
-    # Clean up
-    close_all_figures()
+
+def test_comprehensive_dashboard_reuses_figure(dashboard_df, tmp_path, raw_savefig):
+    fig = create_comprehensive_dashboard(dashboard_df, str(tmp_path / "first.png"))
+    reused = create_comprehensive_dashboard(dashboard_df, str(tmp_path / "second.png"), fig=fig)
+    assert reused is fig
+    assert len(fig.axes) == 9  # 8 panels plus the twin axis, not doubled
+
+
+def test_comprehensive_dashboard_close_after_save(dashboard_df, tmp_path, raw_savefig):
+    save_path = tmp_path / "dashboard.png"
+
+    fig = create_comprehensive_dashboard(dashboard_df, str(save_path), close_after_save=True)
+    assert save_path.is_file()
+    assert fig is None
+
+
+def test_saving_leaves_backend_to_caller(tmp_path):
+    """Saving a plot must not pin a backend for the rest of the process."""
+    # Runs in a fresh interpreter without MPLBACKEND, which conftest sets for this session
+    env = {key: value for key, value in os.environ.items() if key != "MPLBACKEND"}
+    script = f"""
+import matplotlib
+import numpy as np
+from matplotlib.figure import Figure
+from src.visualization import plot_yield_over_time_np
+
+before = dict.__getitem__(matplotlib.rcParams, "backend")
+ax = Figure().subplots()
+plot_yield_over_time_np(np.arange(3), np.arange(3), {str(tmp_path / "yield.png")!r}, ax=ax)
+assert dict.__getitem__(matplotlib.rcParams, "backend") is before
+"""
+    subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).parents[1],
+        env=env,
+        check=True,
+    )